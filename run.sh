@@ -38,6 +38,10 @@ if is_root && need_cmd apt-get; then
     echo "[INFO] Installing Hugging Face CLI (huggingface_hub)..."
     python3 -m pip install -U huggingface_hub >/dev/null 2>&1
   fi
+  if ! python3 -c "import hf_transfer" >/dev/null 2>&1; then
+    echo "[INFO] Installing hf_transfer (fast parallel downloads)..."
+    python3 -m pip install -U hf_transfer >/dev/null 2>&1
+  fi
 fi
 
 # Запуск основного wizard-скрипта (Python)